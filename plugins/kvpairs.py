@@ -5,8 +5,16 @@ the from_entries and to_entries functions in jq:
 https://stedolan.github.io/jq/manual/#to_entries,from_entries,with_entries
 """
 
+import sys
+
 from visidata import Column, SettableColumn, Sheet, vd
 
+vd.option(
+    "kvpairs_compact",
+    False,
+    "store from_entries values as tuples that share a per-column key schema",
+)
+
 
 def _isNullFunc():
     """
@@ -22,6 +30,50 @@ def _isNullFunc():
         return visidata.isNullFunc()
 
 
+class _CompactDict(tuple):
+    """
+    Storage for a single dict value: a shared key schema followed by the
+    values. Subclassing tuple with empty __slots__ keeps instances as small
+    as a plain tuple while letting the column tell them apart from tuples
+    that users store deliberately.
+    """
+
+    __slots__ = ()
+
+    def asdict(self):
+        return dict(zip(self[0], self[1:]))
+
+
+class CompactDictColumn(SettableColumn):
+    """
+    A settable column that stores dict values compactly. Each distinct set of
+    keys becomes a shared, interned schema tuple, and each row only holds a
+    tuple of its values. Values are rebuilt as regular dicts on access, so
+    they display and evaluate in expressions just like the dicts they replace.
+
+    Non-dict values are stored as-is.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._schemas = {}
+
+    def _schema(self, keys):
+        keys = tuple(sys.intern(k) if type(k) is str else k for k in keys)
+        return self._schemas.setdefault(keys, keys)
+
+    def putValue(self, row, val):
+        if type(val) is dict:
+            val = _CompactDict((self._schema(val.keys()), *val.values()))
+        super().putValue(row, val)
+
+    def calcValue(self, row):
+        val = super().calcValue(row)
+        if type(val) is _CompactDict:
+            return val.asdict()
+        return val
+
+
 @Column.api
 def from_entries(col):
     """
@@ -42,7 +94,8 @@ def from_entries(col):
         vd.fail(f"Columns {col.name} is not a list of Key/Value pairs")
 
     new_idx = sheet.columns.index(col) + 1
-    new_col = SettableColumn(col.name)
+    colType = CompactDictColumn if vd.options.kvpairs_compact else SettableColumn
+    new_col = colType(col.name)
     sheet.addColumn(new_col, index=new_idx)
     isNull = _isNullFunc()
     for row in rows:
@@ -11,6 +11,23 @@ the socket:
 
 echo "vd.status('hello from elsewhere!')" | nc -U ~/.visidata/run/remote_control
 
+Or pull rows out of a sheet as JSON lines:
+
+echo "read mysheet" | nc -U ~/.visidata/run/remote_control
+echo 'read {"sheet": "mysheet", "selected": true, "columns": ["a", "b"]}' | nc -U ~/.visidata/run/remote_control
+
+Rows stream back as they are encoded. If a read fails partway through,
+the last line is a JSON object with an "error" key. Each request is handled
+on its own thread, so a long read doesn't hold up other requests. Exec
+requests still run one at a time.
+
+Every request is logged with its timestamp and duration, so a session's
+remote control sheet doubles as a recorded workload. Replay it (or a saved
+copy of it) with `replay-remote-commands` to rerun the requests at their
+original pace, or `replay-remote-commands-fast` to run them back to back.
+Replayed requests go through the socket like any other client's, so the
+reported latency includes the socket round trip.
+
 Warnings/Limitations:
 
 - Don't expect too much
@@ -22,13 +39,34 @@ Warnings/Limitations:
   one place
 """
 
+import json
+import socket
 import socketserver
+import statistics
+import threading
+import time
 from contextlib import suppress
+from itertools import islice
 from pathlib import Path
 
-from visidata import ItemColumn, Sheet, asyncthread, vd
+from visidata import ItemColumn, Progress, Sheet, asyncthread, vd
 from visidata.settings import Command
 
+vd.option(
+    "remote_control_chunk_rows",
+    1000,
+    "number of rows per chunk when streaming rows from a remote control socket",
+)
+
+READ_PREFIX = "read "
+
+# Errors from sending to a client that has already hung up
+CLIENT_GONE = (BrokenPipeError, ConnectionResetError)
+
+# Requests are handled on their own threads, but exec requests change
+# VisiData state that isn't thread-safe, so only run one at a time.
+EXEC_LOCK = threading.Lock()
+
 
 class RemoteControlCommand(Command):
     def __init__(self, execstr):
@@ -45,12 +83,94 @@ class VisiDataRemoteControlHandler(socketserver.BaseRequestHandler):
     def handle(self):
         data = self.request.recv(1024).strip().decode("utf8")
         error = None
+        isRead = data.startswith(READ_PREFIX)
+        timestamp, start = time.time(), time.perf_counter()
+        reply = None
         try:
-            result = int(self.server.sheet.execCommand2(RemoteControlCommand(data)))
+            result = run_request(self.server.sheet, data, self.request.sendall)
+            if not isRead:
+                reply = str(result)
+        except CLIENT_GONE as err:
+            # The client hung up partway through a read
+            result, error = 1, err
         except Exception as err:
             result, error = 1, err
-        self.request.sendall(str(result).encode('utf8'))
-        self.server.sheet.addRow(dict(command=data, exit_code=result, error=error))
+            # Read requests stream JSON lines, so report errors as a final
+            # JSON line rather than a bare exit code mixed in with the data.
+            reply = json.dumps({"error": str(err)}) + "\n" if isRead else str(result)
+        if reply is not None:
+            try:
+                self.request.sendall(reply.encode("utf8"))
+            except CLIENT_GONE as err:
+                # The request already ran, so keep its exit code
+                error = error or err
+        self.server.sheet.addRow(
+            dict(
+                command=data,
+                exit_code=result,
+                error=error,
+                timestamp=timestamp,
+                duration=time.perf_counter() - start,
+            )
+        )
+
+
+def run_request(sheet, data, send):
+    """Run a single remote control request in the context of a sheet
+
+    Pass any streamed output to send(), and return the exit code.
+    """
+
+    if data.startswith(READ_PREFIX):
+        for chunk in iter_read_request(data[len(READ_PREFIX) :].strip()):
+            send(chunk)
+        return 0
+    with EXEC_LOCK:
+        return int(sheet.execCommand2(RemoteControlCommand(data)))
+
+
+def iter_read_request(request):
+    """Generate JSON lines chunks with rows from a named sheet
+
+    The request is either a bare sheet name or a JSON object with a
+    "sheet" name and optional "selected" and "columns" keys.
+    """
+
+    args = json.loads(request) if request.startswith("{") else {"sheet": request}
+    sheet = vd.getSheet(args["sheet"])
+    if sheet is None:
+        raise ValueError(f"No sheet named {args['sheet']}")
+    if "columns" in args:
+        if not isinstance(args["columns"], list):
+            raise ValueError("columns must be a list of column names")
+        colsByName = {col.name: col for col in sheet.columns}
+        missing = [name for name in args["columns"] if name not in colsByName]
+        if missing:
+            raise ValueError(f"No columns named {', '.join(missing)}")
+        cols = [colsByName[name] for name in args["columns"]]
+    else:
+        cols = sheet.visibleCols
+    rows = sheet.rows
+    if args.get("selected"):
+        rows = (row for row in rows if sheet.isSelected(row))
+    yield from iter_jsonl_chunks(rows, cols, vd.options.remote_control_chunk_rows)
+
+
+def iter_jsonl_chunks(rows, cols, chunk_size):
+    """Lazily encode rows as JSON lines, yielding chunk_size rows at a time"""
+
+    rows = iter(rows)
+    while True:
+        chunk = islice(rows, chunk_size)
+        lines = "".join(
+            json.dumps({col.name: col.getTypedValue(row) for col in cols}, default=str)
+            + "\n"
+            for row in chunk
+        )
+        if not lines:
+            return
+        yield lines.encode("utf8")
+
 
 class RemoteControlSheet(Sheet):
     """A sheet that provides rudimentary remote control features
@@ -65,10 +185,20 @@ class RemoteControlSheet(Sheet):
 
     echo "vd.status('hello from elsewhere!')" | nc -U ~/.visidata/run/moo
 
+    or read a sheet's rows back as JSON lines with a "read" request:
+
+    echo "read mysheet" | nc -U ~/.visidata/run/moo
+
     Shut down the socket and remove the file when the sheet closes.
     """
 
-    columns = [ItemColumn("command"), ItemColumn("exit_code"), ItemColumn("error")]
+    columns = [
+        ItemColumn("command"),
+        ItemColumn("exit_code"),
+        ItemColumn("error"),
+        ItemColumn("timestamp", type=float),
+        ItemColumn("duration", type=float),
+    ]
 
     def __init__(self, name):
         super().__init__(name)
@@ -77,10 +207,11 @@ class RemoteControlSheet(Sheet):
         if socket_path.exists() and socket_path.is_socket():
             vd.status(f"Replacing existing socket at {socket_path}")
             socket_path.unlink()
-        self.server = socketserver.UnixStreamServer(
+        self.server = socketserver.ThreadingUnixStreamServer(
             str(socket_path),
             VisiDataRemoteControlHandler,
         )
+        self.server.daemon_threads = True
         self.server.sheet = self
         self.serve()
 
@@ -103,8 +234,158 @@ def confirmQuit(vs, verb="quit"):
         Path(sockname).expanduser().unlink()
 
 
+def send_request(socket_path, data):
+    """Send one request to a remote control socket as a client would
+
+    Return the exit code. Read output is drained as it arrives, keeping
+    only the tail needed to spot a trailing error line.
+    """
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        client.sendall(data.encode("utf8"))
+        tail = b""
+        while chunk := client.recv(65536):
+            tail = (tail + chunk)[-65536:]
+    if not data.startswith(READ_PREFIX):
+        return int(tail)
+    with suppress(IndexError, ValueError):
+        lastLine = json.loads(tail.splitlines()[-1])
+        if isinstance(lastLine, dict) and set(lastLine) == {"error"}:
+            raise RuntimeError(lastLine["error"])
+    return 0
+
+
+def _sleepUntil(deadline, step=0.1):
+    """Sleep in short steps, so a cancelled thread doesn't hang in one long sleep"""
+
+    while (remaining := deadline - time.perf_counter()) > 0:
+        time.sleep(min(step, remaining))
+
+
+class RemoteControlReplaySheet(Sheet):
+    """Replay recorded remote control requests and log how each one went
+
+    The source is a list of recorded requests, as dicts with a "command"
+    and (optionally) a "timestamp". Each request is sent as a client
+    connection to the socket at socket_path, so latency covers the same
+    socket round trip that automation clients see. With realtime set, wait
+    between requests to match the original timing. Otherwise run them as
+    fast as possible. Report throughput and latency when the replay
+    finishes or is cancelled.
+    """
+
+    rowtype = "replayed requests"
+    columns = [
+        ItemColumn("command"),
+        ItemColumn("exit_code"),
+        ItemColumn("error"),
+        ItemColumn("offset", type=float),
+        ItemColumn("latency", type=float),
+    ]
+
+    def iterload(self):
+        timestamps = [r.get("timestamp") for r in self.source if r.get("timestamp")]
+        firstTimestamp = min(timestamps, default=None)
+        start = time.perf_counter()
+        latencies = []
+        try:
+            for recorded in Progress(self.source, gerund="replaying"):
+                data = recorded["command"]
+                timestamp = recorded.get("timestamp")
+                if self.realtime and timestamp and firstTimestamp:
+                    _sleepUntil(start + timestamp - firstTimestamp)
+                offset, error = time.perf_counter() - start, None
+                try:
+                    result = send_request(self.socket_path, data)
+                except Exception as err:
+                    result, error = 1, err
+                latency = time.perf_counter() - start - offset
+                latencies.append(latency)
+                yield dict(
+                    command=data,
+                    exit_code=result,
+                    error=error,
+                    offset=offset,
+                    latency=latency,
+                )
+        finally:
+            self.reportThroughput(latencies, time.perf_counter() - start)
+
+    def reportThroughput(self, latencies, elapsed):
+        if not latencies:
+            vd.status("No requests replayed")
+            return
+        p95 = (
+            statistics.quantiles(latencies, n=20)[-1]
+            if len(latencies) > 1
+            else latencies[0]
+        )
+        vd.status(
+            f"Replayed {len(latencies)}/{len(self.source)} requests in {elapsed:.2f}s "
+            f"({len(latencies) / elapsed:.1f}/s); latency "
+            f"mean {statistics.mean(latencies) * 1000:.1f}ms, "
+            f"p95 {p95 * 1000:.1f}ms, max {max(latencies) * 1000:.1f}ms"
+        )
+
+
+@Sheet.api
+def replayRemoteCommands(sheet, rows, realtime=True):
+    """Replay recorded remote control requests against this session
+
+    Read requests from the sheet's "command" and "timestamp" columns, so a
+    saved and reopened remote control log replays as well as a live one.
+    Send them to this sheet's socket if it is a remote control sheet, or
+    else to the most recently opened remote control sheet.
+    """
+
+    colsByName = {col.name: col for col in sheet.columns}
+    if "command" not in colsByName:
+        vd.fail("No command column to replay")
+    commandCol, timestampCol = colsByName["command"], colsByName.get("timestamp")
+    target = next(
+        (vs for vs in [sheet, *vd.sheets] if isinstance(vs, RemoteControlSheet)),
+        None,
+    )
+    if target is None:
+        vd.fail("No remote control sheet to replay against")
+
+    def _timestamp(row):
+        with suppress(TypeError, ValueError):
+            return float(timestampCol.getValue(row))
+
+    recorded = [
+        dict(
+            command=commandCol.getDisplayValue(row),
+            timestamp=_timestamp(row) if timestampCol else None,
+        )
+        for row in rows
+    ]
+    return vd.push(
+        RemoteControlReplaySheet(
+            f"{sheet.name}_replay",
+            source=recorded,
+            socket_path=target.server.server_address,
+            realtime=realtime,
+        )
+    )
+
+
 def openurl_server(p, filetype):
     return RemoteControlSheet(p.name)
 
 
+Sheet.addCommand(
+    "",
+    "replay-remote-commands",
+    "replayRemoteCommands(selectedRows or rows)",
+    "replay recorded remote control requests at their original pace",
+)
+Sheet.addCommand(
+    "",
+    "replay-remote-commands-fast",
+    "replayRemoteCommands(selectedRows or rows, realtime=False)",
+    "replay recorded remote control requests as fast as possible",
+)
+
 vd.addGlobals({"openurl_server": openurl_server})
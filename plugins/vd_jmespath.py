@@ -1,8 +1,13 @@
 from functools import partial
-from hashlib import sha1
 
 import jmespath
-from visidata import BaseSheet, ExprColumn, vd
+from visidata import BaseSheet, Column, Progress, asyncthread, vd
+
+vd.option(
+    "jmespath_backfill",
+    False,
+    "compute new jmespath columns for all rows in the background",
+)
 
 
 @BaseSheet.api
@@ -19,14 +24,33 @@ def addcol_jmespath(sheet):
         "jmespath-expr",
         completer=completer(sheet),
     )
-    # Create a partial function based on the provided jmespath expression,
-    # and add it as a sheet attribute. This is one way to avoid edge cases
-    # when evaluating jmespath expressions that contain nested quotes.
-    partial_attr = f"_jmespath_search_{sha1(expr.encode('utf8')).hexdigest()}"
-    setattr(sheet, partial_attr, partial(jmespath.search, expr))
-    sheet.addColumnAtCursor(
-        ExprColumn(expr, expr=f"sheet.{partial_attr}(cursorRow)")
-    )
+    # Search each row directly, rather than through a Python expression, so
+    # the column always computes from its own row and nested quotes in the
+    # jmespath expression need no escaping.
+    search = partial(jmespath.search, expr)
+    col = Column(expr, getter=lambda col, row: search(row))
+    sheet.addColumnAtCursor(col)
+    if vd.options.jmespath_backfill:
+        sheet.backfill_jmespath(col)
+
+
+@BaseSheet.api
+@asyncthread
+def backfill_jmespath(sheet, col):
+    """
+    Fill a jmespath column's value cache for every row in the background, so
+    later sorts or frequency tables over it don't block. This uses VisiData's
+    own column cache, which is cleared when the sheet reloads or the column is
+    recalculated. Errors are cached and shown like any other cell error.
+    """
+    col.setCache(True)
+    rows = sheet.rows
+    for row in Progress(rows, gerund="backfilling"):
+        if sheet.rows is not rows:
+            vd.status(f"Sheet reloaded, stopped backfilling {col.name}")
+            return
+        col.getValue(row)
+    vd.status(f"Backfilled jmespath column {col.name}")
 
 
 @BaseSheet.api
@@ -2,18 +2,190 @@
 Launch an embedded ptipython REPL from within VisiData.
 """
 
+import operator
+from itertools import islice
 from pathlib import Path
 
 from ptpython.ipython import InteractiveShellEmbed, embed
-from visidata import LazyChainMap, Sheet, SuspendCurses, VisiData
+from visidata import (
+    Column,
+    ItemColumn,
+    LazyChainMap,
+    Sheet,
+    SuspendCurses,
+    VisiData,
+    vd,
+)
 
+vd.option(
+    "repl_batch_size",
+    1000,
+    "number of rows to pull at a time when loading REPL results",
+)
 
-class Dummy:
-    """Hacks to patch sheet-local variables that we want the REPL to ignore."""
 
-    replayStatus = "dummy"
-    someSelectedRows = "dummy"
-    onlySelectedRows = "dummy"
+# Sheet attributes that could be huge or expensive to evaluate, so the REPL
+# gets lazy proxies for them instead of their values.
+LAZY_SHEET_ATTRS = (
+    "rows",
+    "columns",
+    "selectedRows",
+    "replayStatus",
+    "someSelectedRows",
+    "onlySelectedRows",
+)
+
+
+class LazyAttr:
+    """
+    Stand in for a sheet attribute without evaluating it. Look the attribute
+    up fresh each time the proxy is touched, so expensive properties like
+    selectedRows only run when used, and always reflect the current sheet.
+
+    Proxies support common operations (len, iteration, indexing, comparison
+    and arithmetic), but they are not the underlying type, so isinstance
+    checks and json.dumps fail on them. Use ~proxy to get the underlying
+    value, e.g. json.dumps(~rows).
+    """
+
+    __slots__ = ("_obj", "_name")
+
+    def __init__(self, obj, name):
+        object.__setattr__(self, "_obj", obj)
+        object.__setattr__(self, "_name", name)
+
+    def __invert__(self):
+        return getattr(self._obj, self._name)
+
+    def __getattr__(self, name):
+        return getattr(~self, name)
+
+    def __setattr__(self, name, value):
+        setattr(~self, name, value)
+
+    def __repr__(self):
+        return f"<lazy {type(self._obj).__name__}.{self._name}>"
+
+
+def _forward(name, op):
+    def method(self, *args, **kwargs):
+        return op(~self, *args, **kwargs)
+
+    method.__name__ = name
+    return method
+
+
+def _reflected(op):
+    return lambda value, other: op(other, value)
+
+
+for _name, _op in {
+    "__bool__": operator.truth,
+    "__len__": len,
+    "__iter__": iter,
+    "__reversed__": reversed,
+    "__contains__": operator.contains,
+    "__getitem__": operator.getitem,
+    "__setitem__": operator.setitem,
+    "__call__": lambda value, *args, **kwargs: value(*args, **kwargs),
+    "__str__": str,
+    "__format__": format,
+    "__hash__": hash,
+    "__index__": operator.index,
+    "__int__": int,
+    "__float__": float,
+    "__eq__": operator.eq,
+    "__ne__": operator.ne,
+    "__lt__": operator.lt,
+    "__le__": operator.le,
+    "__gt__": operator.gt,
+    "__ge__": operator.ge,
+    "__add__": operator.add,
+    "__sub__": operator.sub,
+    "__mul__": operator.mul,
+    "__truediv__": operator.truediv,
+    "__floordiv__": operator.floordiv,
+    "__mod__": operator.mod,
+    "__radd__": _reflected(operator.add),
+    "__rsub__": _reflected(operator.sub),
+    "__rmul__": _reflected(operator.mul),
+    "__rtruediv__": _reflected(operator.truediv),
+    "__rfloordiv__": _reflected(operator.floordiv),
+    "__rmod__": _reflected(operator.mod),
+}.items():
+    setattr(LazyAttr, _name, _forward(_name, _op))
+
+
+def _replNamespace(sheet):
+    """
+    Build the REPL namespace from the current sheet and VisiData globals,
+    with lazy proxies in place of attributes that could be huge or
+    expensive to evaluate.
+    """
+    sheetVars = LazyChainMap(sheet, locals=vd.getGlobals())
+    ns = {
+        name: LazyAttr(sheet, name) if name in LAZY_SHEET_ATTRS else sheetVars[name]
+        for name in sheetVars.keys()
+    }
+    ns.update(sheet=sheet, toSheet=vd.openReplResults)
+    return ns
+
+
+class ReplResultsSheet(Sheet):
+    """
+    Load an iterable of results from the REPL in batches. Dict results get a
+    column per key (added as new keys show up), list/tuple results get a
+    column per position, and anything else lands in a single column.
+
+    A one-shot source like a generator can only be loaded once, so reloading
+    the sheet keeps the rows it already has.
+    """
+
+    rowtype = "results"
+    _loaded = False
+
+    def reload(self):
+        if self._loaded and iter(self.source) is self.source:
+            vd.warning("REPL results were already consumed, not reloading")
+            return
+        return super().reload()
+
+    def addColsFor(self, rows):
+        for row in rows:
+            if isinstance(row, dict):
+                keys = row.keys()
+            elif isinstance(row, (list, tuple)):
+                keys = range(len(row))
+            else:
+                keys = [None]
+            for key in keys:
+                if key not in self._knownKeys:
+                    self._knownKeys.add(key)
+                    if key is None:
+                        self.addColumn(Column("value", getter=lambda col, row: row))
+                    else:
+                        self.addColumn(ItemColumn(str(key), key))
+
+    def iterload(self):
+        self._loaded = True
+        self.columns = []
+        self._knownKeys = set()
+        results = iter(self.source)
+        while True:
+            batch = list(islice(results, vd.options.repl_batch_size))
+            if not batch:
+                break
+            self.addColsFor(batch)
+            yield from batch
+
+
+@VisiData.api
+def openReplResults(vd, results, name="repl_results"):
+    """
+    Push a sheet that streams results from an iterable in batches, so large
+    results from the REPL can be browsed in VisiData instead of printed.
+    """
+    return vd.push(ReplResultsSheet(name, source=results))
 
 
 @VisiData.api
@@ -32,7 +204,7 @@ def openRepl(vd):
                 / "history"
             )
             Path.mkdir(history_file.parent, parents=True, exist_ok=True)
-            locals().update(dict(LazyChainMap(Dummy(), vd.sheet, locals=vd.getGlobals())))
+            locals().update(_replNamespace(vd.sheet))
             shell = InteractiveShellEmbed.instance(
                 history_filename=str(history_file),
                 vi_mode=True,